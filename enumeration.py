@@ -1,31 +1,134 @@
 from collections import OrderedDict
-from operator import eq, lt, gt, ge, le, ne
+
+try:
+    from sys import intern
+except ImportError:  # Python 2, where intern() is a built-in
+    pass
 
 
 class NonExistingEnumItemError(Exception):
     pass
 
 
+def _intern_string(string):
+    """
+    Return the interned version of ``string``, or ``string`` itself if it is
+    an instance of a :class:`str` sub-class (which cannot be interned).
+    """
+
+    if type(string) is str:
+        string = intern(string)
+    return string
+
+
+def _get_slot_attribute_names(cls):
+    """
+    Return the names of the attributes stored in the slots declared by
+    ``cls`` itself (i.e., excluding those of its base classes).
+    """
+
+    slot_names = cls.__dict__.get('__slots__', ())
+    if isinstance(slot_names, str):
+        slot_names = (slot_names,)
+
+    attribute_names = []
+    for slot_name in slot_names:
+        if slot_name in ('__dict__', '__weakref__'):
+            continue
+        if slot_name.startswith('__') and not slot_name.endswith('__'):
+            slot_name = '_%s%s' % (cls.__name__.lstrip('_'), slot_name)
+        attribute_names.append(slot_name)
+    return attribute_names
+
+
 class EnumItem(object):
     """An item which exists within an Enum."""
 
-    def __init__(self, item_value, enum_values):
+    __slots__ = (
+        'enum_values',
+        'item_value',
+        '_item_index',
+        '_item_ui_label',
+        '_hash',
+        '_previous_values',
+        '_previous_values_with_self',
+        '_subsequent_values',
+        '_subsequent_values_with_self',
+    )
+
+    _UNPICKLED_SLOTS = frozenset((
+        '_hash',
+        '_previous_values',
+        '_previous_values_with_self',
+        '_subsequent_values',
+        '_subsequent_values_with_self',
+    ))
+
+    def __init__(self, item_value, enum_values, item_index=None):
         """
         :param item_value: The value this item represents
         :param item_value: :class:`basestring`
         :param enum_values: All possible values in the parent Enum
         :type enum_values: :class:`collections.Iterable`
+        :param item_index: The position of ``item_value`` in ``enum_values``,
+            if already known
+        :type item_index: :class:`int`
         """
 
         super(EnumItem, self).__init__()
 
-        assert item_value in enum_values, \
-            "%r is not contained in the Enum's values" % item_value
+        # Only scan the enum values when the index of the item is unknown:
+        if item_index is None:
+            assert item_value in enum_values, \
+                "%r is not contained in the Enum's values" % item_value
+            item_index = enum_values.index(item_value)
+        else:
+            assert enum_values[item_index] == item_value, \
+                "%r is not at index %r in the Enum's values" % (
+                    item_value,
+                    item_index,
+                )
 
         self.enum_values = enum_values
         self.item_value = item_value
-        self._item_index = self.enum_values.index(item_value)
+        self._item_index = item_index
         self._item_ui_label = None
+        self._hash = hash(item_value)
+
+        # The slices of the enum values are computed on first access only, as
+        # computing them all upfront would take O(N^2) memory per Enum:
+        self._previous_values = None
+        self._previous_values_with_self = None
+        self._subsequent_values = None
+        self._subsequent_values_with_self = None
+
+    def __getstate__(self):
+        """
+        Return the state of the item for pickling, which excludes the cached
+        slices of the enum values and the cached hash (the hash of a string
+        differs from one process to another).
+        """
+
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            for slot_name in _get_slot_attribute_names(cls):
+                if slot_name not in self._UNPICKLED_SLOTS and \
+                        hasattr(self, slot_name):
+                    state[slot_name] = getattr(self, slot_name)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the item from the state returned by :meth:`__getstate__`."""
+
+        self._previous_values = None
+        self._previous_values_with_self = None
+        self._subsequent_values = None
+        self._subsequent_values_with_self = None
+
+        for attribute_name, attribute_value in state.items():
+            setattr(self, attribute_name, attribute_value)
+
+        self._hash = hash(self.item_value)
 
     def __repr__(self):
         return '<{}: value={!r}, index={!r}>'.format(
@@ -44,51 +147,82 @@ class EnumItem(object):
 
     def __hash__(self):
         """Return the hash of the item value."""
-        return hash(self.item_value)
+        return self._hash
 
     def __eq__(self, other):
-        return self._compare(other, eq)
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        if other.enum_values is not self.enum_values and \
+                other.enum_values != self.enum_values:
+            return NotImplemented
+        return self._item_index == other._item_index
 
     def __ne__(self, other):
-        return self._compare(other, ne)
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        if other.enum_values is not self.enum_values and \
+                other.enum_values != self.enum_values:
+            return NotImplemented
+        return self._item_index != other._item_index
 
     def __lt__(self, other):
-        return self._compare(other, lt)
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        if other.enum_values is not self.enum_values and \
+                other.enum_values != self.enum_values:
+            return NotImplemented
+        return self._item_index < other._item_index
 
     def __le__(self, other):
-        return self._compare(other, le)
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        if other.enum_values is not self.enum_values and \
+                other.enum_values != self.enum_values:
+            return NotImplemented
+        return self._item_index <= other._item_index
 
     def __gt__(self, other):
-        return self._compare(other, gt)
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        if other.enum_values is not self.enum_values and \
+                other.enum_values != self.enum_values:
+            return NotImplemented
+        return self._item_index > other._item_index
 
     def __ge__(self, other):
-        return self._compare(other, ge)
-
-    def _compare(self, other_item, operator):
-        if not isinstance(other_item, self.__class__):
-            comparison = NotImplemented
-        elif self.enum_values != other_item.enum_values:
-            comparison = NotImplemented
-        else:
-            comparison = operator(self._item_index, other_item._item_index)
-
-        return comparison
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        if other.enum_values is not self.enum_values and \
+                other.enum_values != self.enum_values:
+            return NotImplemented
+        return self._item_index >= other._item_index
 
     @property
     def previous_values(self):
-        return self.enum_values[:self._item_index]
+        if self._previous_values is None:
+            self._previous_values = self.enum_values[:self._item_index]
+        return self._previous_values
 
     @property
     def previous_values_with_self(self):
-        return self.enum_values[:(self._item_index + 1)]
+        if self._previous_values_with_self is None:
+            self._previous_values_with_self = \
+                self.enum_values[:(self._item_index + 1)]
+        return self._previous_values_with_self
 
     @property
     def subsequent_values(self):
-        return self.enum_values[(self._item_index + 1):]
+        if self._subsequent_values is None:
+            self._subsequent_values = \
+                self.enum_values[(self._item_index + 1):]
+        return self._subsequent_values
 
     @property
     def subsequent_values_with_self(self):
-        return self.enum_values[self._item_index:]
+        if self._subsequent_values_with_self is None:
+            self._subsequent_values_with_self = \
+                self.enum_values[self._item_index:]
+        return self._subsequent_values_with_self
 
     def get_ui_label(self):
         """
@@ -115,33 +249,55 @@ class Enum(object):
     def __init__(self, *items):
         super(Enum, self).__init__()
 
-        # Ensure that the values and labels are unique:
-        values, labels = zip(*items)
-        unique_values_count = len(set(values))
-        unique_labels_count = len(set(labels))
-        assert unique_labels_count == len(items), 'The labels must be unique'
-        assert unique_values_count == len(items), 'The values must be unique'
+        # The values are interned so that looking them up is mostly down to
+        # comparing their identities. They are all needed upfront as each item
+        # receives them:
+        values = tuple(_intern_string(value) for value, label in items)
+
+        self.has_ui_labels = False
+        self._value_set = frozenset(values)
 
         # Generate EnumItems based the items passed, ensuring that all values
-        # and labels are strings.
-        self._items = OrderedDict()
-        for value, label in items:
+        # and labels are unique strings. Each item is also set as an instance
+        # attribute so that it can be looked up without calling __getattr__.
+        # The items by label are only used for look-ups, so they don't need
+        # to be ordered; the items by value keep the order of the enum.
+        self._items = {}
+        self._items_by_values = OrderedDict()
+        # Sub-classes of EnumItem which override its constructor may only
+        # accept the item value and the enum values:
+        item_class_accepts_index = \
+            self.item_class.__init__ == EnumItem.__init__
+        for item_index, (value, label) in enumerate(items):
             assert isinstance(value, str), \
                 'Value %r must be a string' % value
             assert isinstance(label, str), \
                 'Label %r must be a string' % label
-
-            self._items[label] = self.item_class(value, values)
-
-        self.has_ui_labels = False
+            value = values[item_index]
+            label = _intern_string(label)
+            assert value not in self._items_by_values, \
+                'The values must be unique'
+            assert label not in self._items, 'The labels must be unique'
+            assert not hasattr(self, label), \
+                'Label %r clashes with an Enum attribute' % label
+
+            if item_class_accepts_index:
+                enum_item = self.item_class(value, values, item_index)
+            else:
+                enum_item = self.item_class(value, values)
+            self._items[label] = enum_item
+            self._items_by_values[value] = enum_item
+            super(Enum, self).__setattr__(label, enum_item)
 
     def __getattr__(self, label):
-        """Return the enum item for ``label``."""
+        """
+        Report that ``label`` is unknown.
 
-        if label not in self._items:
-            raise AttributeError('%r is not a valid enum label' % label)
+        Enum items are set as instance attributes, so this is only called for
+        labels which do not exist.
+        """
 
-        return self._items[label]
+        raise AttributeError('%r is not a valid enum label' % label)
 
     def __setattr__(self, name, value):
         """
@@ -154,9 +310,24 @@ class Enum(object):
 
         super(Enum, self).__setattr__(name, value)
 
+    def __delattr__(self, name):
+        """
+        Delete attribute ``name`` providing ``name`` does not correspond to an
+        enum label.
+        """
+
+        assert name not in self._items, 'Enum items cannot be overridden'
+
+        super(Enum, self).__delattr__(name)
+
+    def __contains__(self, item_value):
+        try:
+            return item_value in self._value_set
+        except TypeError:  # item_value is unhashable
+            return False
+
     def __iter__(self):
-        for enum_item in self._items.values():
-            yield enum_item.item_value
+        return iter(self._items_by_values)
 
     def __len__(self):
         return len(self._items)
@@ -170,8 +341,12 @@ class Enum(object):
             a given enum item value.
         """
 
-        enum_item_values = self._items.values()
-        assert set(enum_item_values) == set(ui_labels.keys()), \
+        # As the keys in ui_labels are unique, it has exactly one entry per
+        # enum item if it has as many entries as there are items and each
+        # item is found in it:
+        enum_item_values = self._items_by_values.values()
+        assert len(ui_labels) == len(enum_item_values) and \
+            all(enum_item in ui_labels for enum_item in enum_item_values), \
             "All the enum item values must have a UI label."
 
         for enum_item in enum_item_values:
@@ -189,26 +364,24 @@ class Enum(object):
         """
 
         enum_items_and_labels = []
-        for enum_item in self._items.values():
+        for enum_item in self._items_by_values.values():
             enum_items_and_labels.append((enum_item, enum_item.get_ui_label()))
 
         return tuple(enum_items_and_labels)
 
     def get_item_by_value(self, item_value):
-        if item_value not in self:
+        try:
+            item = self._items_by_values[item_value]
+        except (KeyError, TypeError):
             raise NonExistingEnumItemError(item_value)
 
-        items_by_values = self.get_items_by_values()
-        item = items_by_values[item_value]
         return item
 
     def get_items_by_values(self):
         """
+        :return: The enum items keyed by their values. This mapping is shared,
+            so it must not be modified
         :rtype: :class:`collections.OrderedDict`
         """
 
-        items_by_values = OrderedDict()
-        for enum_item in self._items.values():
-            items_by_values[enum_item.item_value] = enum_item
-
-        return items_by_values
+        return self._items_by_values
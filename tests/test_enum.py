@@ -1,13 +1,12 @@
 # -*- coding: utf-8 -*-
-from collections import OrderedDict
+import copy
+import os
+import pickle
+import subprocess
+import sys
+from operator import eq, ge, gt, le, lt, ne
 
-from nose.tools import assert_false
-from nose.tools import assert_is_instance
-from nose.tools import assert_raises
-from nose.tools import assert_raises_regexp
-from nose.tools import eq_
-from nose.tools import ok_
-from nose.tools import raises
+import pytest
 
 from enumeration import Enum, EnumItem, NonExistingEnumItemError
 
@@ -20,308 +19,566 @@ AGES_OF_MAN = (
     'elderly',
 )
 
+AGES_OF_MAN_LABELS = (
+    'BABY',
+    'TODDLER',
+    'CHILD',
+    'TEENAGER',
+    'ADULT',
+    'ELDERLY',
+)
+
+AGES_OF_MAN_PAIRS = tuple(zip(AGES_OF_MAN, AGES_OF_MAN_LABELS))
+
+AGES_OF_MAN_UI_LABELS = (
+    ('BABY', 'Baby'),
+    ('TODDLER', 'Toddler'),
+    ('CHILD', 'Child'),
+    ('TEENAGER', 'Teenager'),
+    ('ADULT', 'Adult'),
+    ('ELDERLY', 'Elderly'),
+)
+
+
+def _create_ages_of_man_enum():
+    return Enum(*AGES_OF_MAN_PAIRS)
+
+
+def _get_items_ui_labels(enum):
+    return {
+        getattr(enum, label): ui_label
+        for label, ui_label in AGES_OF_MAN_UI_LABELS
+    }
+
+
+@pytest.fixture(scope='module')
+def ages_of_man_enum():
+    """An Enum shared by all the tests which do not modify it."""
+    return _create_ages_of_man_enum()
+
+
+@pytest.fixture
+def mutable_ages_of_man_enum():
+    """An Enum created for each test which modifies it."""
+    return _create_ages_of_man_enum()
+
+
+# { Tests for :class:`Enum`
+
+# { Constructor tests
+
+
+@pytest.mark.parametrize(
+    'items',
+    [
+        # Values must be strings:
+        ((3.14, 'Pi'),),
+        # Labels must be strings:
+        (('Pi', 3.14),),
+        # Values must be unique:
+        (('1', 'One'), ('1', 'Uno')),
+        # Labels must be unique:
+        (('1', 'One'), ('1.0', 'One')),
+        # Labels must not shadow the Enum's own attributes:
+        (('1', 'get_ui_labels'),),
+        (('1', '_value_set'),),
+    ],
+    ids=[
+        'non_string_values',
+        'non_string_labels',
+        'duplicated_values',
+        'duplicated_labels',
+        'label_clashing_with_method',
+        'label_clashing_with_attribute',
+    ],
+)
+def test_constructor_with_invalid_items(items):
+    with pytest.raises(AssertionError):
+        Enum(*items)
+
+
+def test_constructor_with_string_subclasses():
+    """Values and labels can be instances of str sub-classes."""
+
+    class Text(str):
+        pass
+
+    enum = Enum((Text('1'), Text('ONE')))
+
+    assert enum.ONE.item_value == '1'
+
+
+# { Enum item retrieval tests
+
+
+@pytest.mark.parametrize('item_value, label', AGES_OF_MAN_PAIRS)
+def test_getattr_for_known_label(ages_of_man_enum, item_value, label):
+    """Enum labels map to their respective EnumItem instances."""
+
+    retrieved_enum_item = getattr(ages_of_man_enum, label)
+    expected_enum_item = EnumItem(item_value, AGES_OF_MAN)
+    assert retrieved_enum_item == expected_enum_item
+
+
+def test_getattr_for_unknown_label(ages_of_man_enum):
+    """Trying to access an non-existent label raises an AttributeError."""
+
+    with pytest.raises(AttributeError):
+        ages_of_man_enum.COW
+
+
+# { Attribute setting tests
+
+
+def test_enum_item_overriding(mutable_ages_of_man_enum):
+    """Enum items cannot be overridden."""
+
+    with pytest.raises(AssertionError):
+        mutable_ages_of_man_enum.ADULT = None
+
+
+def test_enum_item_deletion(mutable_ages_of_man_enum):
+    """Enum items cannot be deleted."""
+
+    with pytest.raises(AssertionError):
+        del mutable_ages_of_man_enum.ADULT
+
+    assert mutable_ages_of_man_enum.ADULT.item_value == 'adult'
+
+
+def test_deleting_non_enum_item(mutable_ages_of_man_enum):
+    """Attributes other than enum items can be deleted."""
+
+    mutable_ages_of_man_enum.other = 'Something'
+    del mutable_ages_of_man_enum.other
+
+    assert not hasattr(mutable_ages_of_man_enum, 'other')
+
+
+def test_setting_non_enum_item(mutable_ages_of_man_enum):
+    """Attributes other than enum items can be set."""
+
+    mutable_ages_of_man_enum.other = 'Something'
+
+    assert mutable_ages_of_man_enum.other == 'Something'
+
+
+# { Contains test
+
 
-class TestEnum(object):
-    """Tests for :class:`Enum`."""
+@pytest.mark.parametrize('item_value', AGES_OF_MAN)
+def test_contains_with_known_value(ages_of_man_enum, item_value):
+    assert item_value in ages_of_man_enum
 
-    def setup(self):
-        self.ages_of_man_enum = Enum(
-            *zip(
-                AGES_OF_MAN,
-                ('BABY', 'TODDLER', 'CHILD', 'TEENAGER', 'ADULT', 'ELDERLY')
-            )
-        )
 
-    # { Constructor tests
+def test_contains_with_unknown_value(ages_of_man_enum):
+    assert 'sheep' not in ages_of_man_enum
 
-    def test_constructor_with_non_string_values(self):
-        """Values must be strings."""
-        assert_raises(AssertionError, Enum, (3.14, 'Pi'))
 
-    def test_constructor_with_non_string_labels(self):
-        """Labels must be strings."""
-        assert_raises(AssertionError, Enum, ('Pi', 3.14))
+def test_contains_with_unhashable_value(ages_of_man_enum):
+    assert [] not in ages_of_man_enum
 
-    def test_constructor_with_duplicated_values(self):
-        """Values must be unique."""
-        assert_raises(AssertionError, Enum, ('1', 'One'), ('1', 'Uno'))
 
-    def test_constructor_with_duplicated_labels(self):
-        """Labels must be unique."""
-        assert_raises(AssertionError, Enum, ('1', 'One'), ('1.0', 'One'))
+# }
 
-    # { Enum item retrieval tests
 
-    def test_getattr_for_known_label(self):
-        """Enum labels map to their respective EnumItem instances."""
+def test_iter(ages_of_man_enum):
+    """Iteration happens over the enum values."""
 
-        retrieved_enum_item = self.ages_of_man_enum.ADULT
-        expected_enum_item = EnumItem('adult', AGES_OF_MAN)
-        eq_(retrieved_enum_item, expected_enum_item)
+    assert tuple(ages_of_man_enum) == AGES_OF_MAN
 
-    @raises(AttributeError)
-    def test_getattr_for_unknown_label(self):
-        """Trying to access an non-existent label raises an AttributeError."""
 
-        self.ages_of_man_enum.COW
+def test_enum_length(ages_of_man_enum):
+    assert len(AGES_OF_MAN) == len(ages_of_man_enum)
 
-    # { Attribute setting tests
 
-    @raises(AssertionError)
-    def test_enum_item_overriding(self):
-        """Enum items cannot be overridden."""
+def test_getting_items_by_values(ages_of_man_enum):
+    expected_items_by_values = {
+        'baby': ages_of_man_enum.BABY,
+        'toddler': ages_of_man_enum.TODDLER,
+        'child': ages_of_man_enum.CHILD,
+        'teenager': ages_of_man_enum.TEENAGER,
+        'adult': ages_of_man_enum.ADULT,
+        'elderly': ages_of_man_enum.ELDERLY,
+    }
 
-        self.ages_of_man_enum.ADULT = None
+    items_by_values = ages_of_man_enum.get_items_by_values()
+    assert items_by_values == expected_items_by_values
+    assert tuple(items_by_values) == AGES_OF_MAN
 
-    def test_setting_non_enum_item(self):
-        """Attributes other than enum items can be set."""
 
-        self.ages_of_man_enum.other = 'Something'
+def test_getting_existing_item_by_value(ages_of_man_enum):
+    assert ages_of_man_enum.ADULT == \
+        ages_of_man_enum.get_item_by_value('adult')
 
-        eq_(self.ages_of_man_enum.other, 'Something')
 
-    # { Contains test
+def test_getting_non_existing_item_by_value(ages_of_man_enum):
+    non_existing_item_value = 'sheep'
+    with pytest.raises(NonExistingEnumItemError,
+                       match=non_existing_item_value):
+        ages_of_man_enum.get_item_by_value(non_existing_item_value)
 
-    def test_contains_with_known_value(self):
-        ok_('baby' in self.ages_of_man_enum)
 
-    def test_contains_with_unknown_value(self):
-        assert_false('sheep' in self.ages_of_man_enum)
+def test_getting_item_by_unhashable_value(ages_of_man_enum):
+    with pytest.raises(NonExistingEnumItemError):
+        ages_of_man_enum.get_item_by_value([])
 
-    # }
 
-    def test_iter(self):
-        """Iteration happens over the enum values."""
+def test_setting_ui_labels(mutable_ages_of_man_enum):
+    assert not mutable_ages_of_man_enum.has_ui_labels
 
-        eq_(tuple(self.ages_of_man_enum), AGES_OF_MAN)
+    items_ui_labels = _get_items_ui_labels(mutable_ages_of_man_enum)
+    mutable_ages_of_man_enum.set_ui_labels(items_ui_labels)
+    assert {
+        enum_item: enum_item._item_ui_label for enum_item in items_ui_labels
+    } == items_ui_labels
 
-    def test_length(self):
-        eq_(len(AGES_OF_MAN), len(self.ages_of_man_enum))
+    assert mutable_ages_of_man_enum.has_ui_labels
 
-    def test_getting_items_by_values(self):
-        expected_items_by_values = OrderedDict((
-            ('baby', self.ages_of_man_enum.BABY),
-            ('toddler', self.ages_of_man_enum.TODDLER),
-            ('child', self.ages_of_man_enum.CHILD),
-            ('teenager', self.ages_of_man_enum.TEENAGER),
-            ('adult', self.ages_of_man_enum.ADULT),
-            ('elderly', self.ages_of_man_enum.ELDERLY),
-        ))
 
-        eq_(self.ages_of_man_enum.get_items_by_values(),
-            expected_items_by_values)
+def test_setting_missing_key(mutable_ages_of_man_enum):
+    """Every enum item has to receive a label"""
+    items_ui_labels = {
+        mutable_ages_of_man_enum.BABY: "Baby",
+    }
 
-    def test_getting_existing_item_by_value(self):
-        eq_(
-            self.ages_of_man_enum.ADULT,
-            self.ages_of_man_enum.get_item_by_value('adult'),
-        )
+    with pytest.raises(AssertionError):
+        mutable_ages_of_man_enum.set_ui_labels(items_ui_labels)
 
-    def test_getting_non_existing_item_by_value(self):
-        non_existing_item_value = 'sheep'
-        assert_raises_regexp(
-            NonExistingEnumItemError,
-            non_existing_item_value,
-            self.ages_of_man_enum.get_item_by_value,
-            non_existing_item_value,
-        )
+    assert not mutable_ages_of_man_enum.has_ui_labels
 
-    def test_setting_ui_labels(self):
-        assert_false(self.ages_of_man_enum.has_ui_labels)
 
-        items_ui_labels = {
-            self.ages_of_man_enum.BABY: "Baby",
-            self.ages_of_man_enum.TODDLER: "Toddler",
-            self.ages_of_man_enum.CHILD: "Child",
-            self.ages_of_man_enum.TEENAGER: "Teenager",
-            self.ages_of_man_enum.ADULT: "Adult",
-            self.ages_of_man_enum.ELDERLY: "Elderly",
-        }
-        self.ages_of_man_enum.set_ui_labels(items_ui_labels)
-        for enum_item, item_label in items_ui_labels.items():
-            eq_(enum_item._item_ui_label, item_label)
+def test_setting_extra_key(mutable_ages_of_man_enum):
+    """Only the enum items can receive a label"""
+    items_ui_labels = _get_items_ui_labels(mutable_ages_of_man_enum)
+    items_ui_labels[EnumItem('Cow', ('Sheep', 'Cow'))] = "Cow"
 
-        ok_(self.ages_of_man_enum.has_ui_labels)
+    with pytest.raises(AssertionError):
+        mutable_ages_of_man_enum.set_ui_labels(items_ui_labels)
 
-    def test_setting_missing_key(self):
-        """Every enum item has to receive a label"""
-        items_ui_labels = {
-            self.ages_of_man_enum.BABY: "Baby",
-        }
+    assert not mutable_ages_of_man_enum.has_ui_labels
 
-        assert_raises(AssertionError,
-                      self.ages_of_man_enum.set_ui_labels,
-                      items_ui_labels)
 
-        assert_false(self.ages_of_man_enum.has_ui_labels)
+def test_getting_ui_labels(mutable_ages_of_man_enum):
+    items_ui_labels = _get_items_ui_labels(mutable_ages_of_man_enum)
+    mutable_ages_of_man_enum.set_ui_labels(items_ui_labels)
 
-    def test_getting_ui_labels(self):
-        items_ui_labels = OrderedDict((
-            (self.ages_of_man_enum.BABY, 'Baby'),
-            (self.ages_of_man_enum.TODDLER, 'Toddler'),
-            (self.ages_of_man_enum.CHILD, 'Child'),
-            (self.ages_of_man_enum.TEENAGER, 'Teenager'),
-            (self.ages_of_man_enum.ADULT, 'Adult'),
-            (self.ages_of_man_enum.ELDERLY, 'Elderly'),
-        ))
-        self.ages_of_man_enum.set_ui_labels(items_ui_labels)
-        eq_(self.ages_of_man_enum.get_ui_labels(),
-            tuple(items_ui_labels.items()))
+    expected_ui_labels = tuple(
+        (getattr(mutable_ages_of_man_enum, label), ui_label)
+        for label, ui_label in AGES_OF_MAN_UI_LABELS
+    )
+    assert mutable_ages_of_man_enum.get_ui_labels() == expected_ui_labels
 
-    def test_subclassing(self):
-        """
-        The Enum can be sub-classed and a custom EnumItem implementation used.
 
-        """
+def test_subclassing():
+    """
+    The Enum can be sub-classed and a custom EnumItem implementation used.
 
-        class BetterEnumItem(EnumItem):
-            pass
+    """
 
-        class BetterEnum(Enum):
-            item_class = BetterEnumItem
-
-        better_enum = BetterEnum(
-            ('true', 'YES'),
-            ('false', 'NOPE'),
-        )
-
-        assert_is_instance(better_enum.YES, BetterEnumItem)
-        eq_("<BetterEnumItem: value='true', index=0>", repr(better_enum.YES))
-
-
-class TestEnumItem(object):
-    """Tests for :class:`EnumItem`."""
-
-    def setup(self):
-        self.enum1_item1 = EnumItem('baby', AGES_OF_MAN)
-        self.enum1_item1_copy = EnumItem('baby', AGES_OF_MAN)
-        self.enum1_item2 = EnumItem('toddler', AGES_OF_MAN)
-        self.enum2_item1 = EnumItem('Cow', ('Sheep', 'Cow'))
-
-    def test_item_value_not_in_enum_values(self):
-        """
-        The constructor checks that the item's value is one of the values enum.
-
-        """
-
-        assert_raises(AssertionError, EnumItem, 'Dead', AGES_OF_MAN)
-
-    def test_repr(self):
-        enum_item = EnumItem('baby', AGES_OF_MAN)
-
-        eq_(repr(enum_item), "<EnumItem: value='baby', index=0>")
-
-    def test_str(self):
-        """The str representation is that of the item value."""
-        item_value = 'baby'
-        enum_item = EnumItem(item_value, AGES_OF_MAN)
-
-        eq_(str(enum_item), str(item_value))
-
-    def test_length(self):
-        """The length is that of the item value."""
-        item_value = 'baby'
-        enum_item = EnumItem(item_value, AGES_OF_MAN)
-
-        eq_(len(enum_item), len(item_value))
+    class BetterEnumItem(EnumItem):
+        pass
 
-    def test_hash(self):
-        """The hash is the same as the hash of the item value."""
-        item_value = 'baby'
-        enum_item = EnumItem(item_value, AGES_OF_MAN)
-
-        eq_(hash(enum_item), hash(item_value))
+    class BetterEnum(Enum):
+        item_class = BetterEnumItem
 
-    # { Equality tests
+    better_enum = BetterEnum(
+        ('true', 'YES'),
+        ('false', 'NOPE'),
+    )
 
-    def test_comparison_with_heterogenous_objects(self):
-        """Rich comparison is only supported with items of the same enum."""
-        eq_(self.enum1_item1.__eq__('baby'), NotImplemented)
-        eq_(self.enum1_item1.__eq__(self.enum2_item1), NotImplemented)
+    assert isinstance(better_enum.YES, BetterEnumItem)
+    assert "<BetterEnumItem: value='true', index=0>" == repr(better_enum.YES)
 
-    def test_equals(self):
-        """The item_value is considered as the basis of the equality check."""
-        eq_(self.enum1_item1, self.enum1_item1)
-        eq_(self.enum1_item1, self.enum1_item1_copy)
-        assert_false(self.enum1_item1 == self.enum1_item2)
 
-    def test_not_equals(self):
-        ok_(self.enum1_item1 != self.enum1_item2)
-        assert_false(self.enum1_item1 != self.enum1_item1)
-        assert_false(self.enum1_item1 != self.enum1_item1_copy)
+def test_subclassing_with_custom_item_constructor():
+    """
+    Custom EnumItem implementations can keep a constructor which only takes
+    the item value and the enum values.
 
-    # { Inequality tests
+    """
 
-    def test_less_than(self):
-        """The index is used when determining less than comparisons."""
-        ok_(self.enum1_item1 < self.enum1_item2)
-        assert_false(self.enum1_item1 < self.enum1_item1)
-        assert_false(self.enum1_item2 < self.enum1_item1)
+    class CustomEnumItem(EnumItem):
 
-    def test_less_than_or_equal_to(self):
-        """
-        The index is used when determining less than or equal to comparisons.
+        def __init__(self, item_value, enum_values):
+            super(CustomEnumItem, self).__init__(item_value, enum_values)
 
-        """
-        ok_(self.enum1_item1 <= self.enum1_item2)
-        ok_(self.enum1_item1 <= self.enum1_item1)
-        assert_false(self.enum1_item2 <= self.enum1_item1)
+    class CustomEnum(Enum):
+        item_class = CustomEnumItem
 
-    def test_greater_than(self):
-        """The index is used when determining greater than comparisons."""
-        ok_(self.enum1_item2 > self.enum1_item1)
-        assert_false(self.enum1_item1 > self.enum1_item1_copy)
-        assert_false(self.enum1_item1 > self.enum1_item2)
+    custom_enum = CustomEnum(
+        ('true', 'YES'),
+        ('false', 'NOPE'),
+    )
 
-    def test_greater_than_or_equal_to(self):
-        """
-        The index is used when determining greater than or equal to comparisons.
+    assert isinstance(custom_enum.NOPE, CustomEnumItem)
+    assert "<CustomEnumItem: value='false', index=1>" == \
+        repr(custom_enum.NOPE)
 
-        """
-        ok_(self.enum1_item2 >= self.enum1_item1)
-        ok_(self.enum1_item1 >= self.enum1_item1_copy)
-        assert_false(self.enum1_item1 >= self.enum1_item2)
 
-    # { Tests for retrieving previous and subsequent values
+# { Tests for :class:`EnumItem`
 
-    def test_previous_values(self):
-        eq_(self.enum1_item1.previous_values, tuple())
-        eq_(self.enum1_item2.previous_values, ('baby',))
 
-    def test_previous_values_with_self(self):
-        eq_(self.enum1_item1.previous_values_with_self, ('baby',))
-        eq_(self.enum1_item2.previous_values_with_self, ('baby', 'toddler'))
+@pytest.fixture(scope='module')
+def enum1_item1():
+    return EnumItem('baby', AGES_OF_MAN)
+
+
+@pytest.fixture(scope='module')
+def enum1_item1_copy():
+    return EnumItem('baby', AGES_OF_MAN)
+
+
+@pytest.fixture(scope='module')
+def enum1_item2():
+    return EnumItem('toddler', AGES_OF_MAN)
+
+
+@pytest.fixture(scope='module')
+def enum1_penultimate_item():
+    return EnumItem('adult', AGES_OF_MAN)
+
+
+@pytest.fixture(scope='module')
+def enum1_last_item():
+    return EnumItem('elderly', AGES_OF_MAN)
+
+
+@pytest.fixture(scope='module')
+def enum2_item1():
+    return EnumItem('Cow', ('Sheep', 'Cow'))
+
+
+@pytest.fixture
+def mutable_enum1_item1():
+    """An EnumItem created for each test which modifies its UI label."""
+    return EnumItem('baby', AGES_OF_MAN)
+
+
+def test_item_value_not_in_enum_values():
+    """
+    The constructor checks that the item's value is one of the values enum.
+
+    """
+
+    with pytest.raises(AssertionError):
+        EnumItem('Dead', AGES_OF_MAN)
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickling(protocol):
+    enum_item = EnumItem('toddler', AGES_OF_MAN)
+    enum_item.set_ui_label('Toddler')
+    enum_item.previous_values
+
+    unpickled_enum_item = pickle.loads(pickle.dumps(enum_item, protocol))
+
+    assert unpickled_enum_item == enum_item
+    assert unpickled_enum_item.get_ui_label() == 'Toddler'
+    assert unpickled_enum_item.previous_values == ('baby',)
+    assert unpickled_enum_item.subsequent_values == AGES_OF_MAN[2:]
+
+
+class SlottedEnumItem(EnumItem):
+    """An EnumItem sub-class which declares its own slots."""
+
+    __slots__ = ('extra', '__private')
+
+    def get_private(self):
+        return self.__private
+
+    def set_private(self, value):
+        self.__private = value
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickling_subclass_with_slots(protocol):
+    enum_item = SlottedEnumItem('toddler', AGES_OF_MAN)
+    enum_item.extra = 42
+    enum_item.set_private('secret')
+
+    unpickled_enum_item = pickle.loads(pickle.dumps(enum_item, protocol))
+
+    assert unpickled_enum_item == enum_item
+    assert unpickled_enum_item.extra == 42
+    assert unpickled_enum_item.get_private() == 'secret'
+
+
+def test_copying_subclass_with_slots():
+    enum_item = SlottedEnumItem('toddler', AGES_OF_MAN)
+    enum_item.extra = 42
+
+    assert copy.copy(enum_item).extra == 42
+
+
+def test_unpickling_in_another_process():
+    """
+    The hash of an unpickled item is that of its value in the process which
+    unpickles it, even though string hashes differ between processes.
+
+    """
+    unpickling_script = (
+        'import pickle, sys\n'
+        'stdin = getattr(sys.stdin, "buffer", sys.stdin)\n'
+        'enum_item = pickle.loads(stdin.read())\n'
+        'print(hash(enum_item) == hash(enum_item.item_value))\n'
+    )
+    hash_seed = '2' if os.environ.get('PYTHONHASHSEED') == '1' else '1'
+    environment = dict(
+        os.environ,
+        PYTHONHASHSEED=hash_seed,
+        PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    unpickling_process = subprocess.Popen(
+        [sys.executable, '-c', unpickling_script],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=environment,
+    )
+    enum_item = EnumItem('baby', AGES_OF_MAN)
+    output, _ = unpickling_process.communicate(pickle.dumps(enum_item, 2))
+
+    assert output.strip() == b'True'
+
+
+def test_repr(enum1_item1):
+    assert repr(enum1_item1) == "<EnumItem: value='baby', index=0>"
+
+
+def test_precomputed_item_index(enum1_item2):
+    """The item index can be passed in instead of being looked up."""
+    enum_item = EnumItem('toddler', AGES_OF_MAN, 1)
+
+    assert enum_item == enum1_item2
+    assert repr(enum_item) == "<EnumItem: value='toddler', index=1>"
+
+
+def test_precomputed_item_index_mismatch():
+    """The item index passed must be that of the item value."""
+    with pytest.raises(AssertionError):
+        EnumItem('toddler', AGES_OF_MAN, 0)
+
+
+@pytest.mark.parametrize(
+    'function',
+    [str, len, hash],
+    ids=lambda function: function.__name__,
+)
+def test_item_value_delegation(enum1_item1, function):
+    """
+    The str representation, length and hash are those of the item value.
+
+    """
+    assert function(enum1_item1) == function(enum1_item1.item_value)
+
+
+# { Equality tests
+
+
+def test_comparison_with_heterogenous_objects(enum1_item1, enum2_item1):
+    """Rich comparison is only supported with items of the same enum."""
+    assert enum1_item1.__eq__('baby') is NotImplemented
+    assert enum1_item1.__eq__(enum2_item1) is NotImplemented
+
+
+@pytest.mark.parametrize(
+    'left_item_name, operator, right_item_name, expected_result',
+    [
+        # The item_value is considered as the basis of the equality check:
+        ('enum1_item1', eq, 'enum1_item1', True),
+        ('enum1_item1', eq, 'enum1_item1_copy', True),
+        ('enum1_item1', eq, 'enum1_item2', False),
+        ('enum1_item1', ne, 'enum1_item2', True),
+        ('enum1_item1', ne, 'enum1_item1', False),
+        ('enum1_item1', ne, 'enum1_item1_copy', False),
+        # The index is used when determining inequalities:
+        ('enum1_item1', lt, 'enum1_item2', True),
+        ('enum1_item1', lt, 'enum1_item1', False),
+        ('enum1_item2', lt, 'enum1_item1', False),
+        ('enum1_item1', le, 'enum1_item2', True),
+        ('enum1_item1', le, 'enum1_item1', True),
+        ('enum1_item2', le, 'enum1_item1', False),
+        ('enum1_item2', gt, 'enum1_item1', True),
+        ('enum1_item1', gt, 'enum1_item1_copy', False),
+        ('enum1_item1', gt, 'enum1_item2', False),
+        ('enum1_item2', ge, 'enum1_item1', True),
+        ('enum1_item1', ge, 'enum1_item1_copy', True),
+        ('enum1_item1', ge, 'enum1_item2', False),
+    ],
+)
+def test_rich_comparison(
+    request,
+    left_item_name,
+    operator,
+    right_item_name,
+    expected_result,
+):
+    left_item = request.getfixturevalue(left_item_name)
+    right_item = request.getfixturevalue(right_item_name)
+
+    assert operator(left_item, right_item) is expected_result
+
+
+# { Tests for retrieving previous and subsequent values
+
+
+@pytest.mark.parametrize(
+    'item_name, attribute_name, expected_values',
+    [
+        ('enum1_item1', 'previous_values', ()),
+        ('enum1_item2', 'previous_values', ('baby',)),
+        ('enum1_item1', 'previous_values_with_self', ('baby',)),
+        ('enum1_item2', 'previous_values_with_self', ('baby', 'toddler')),
+    ],
+)
+def test_previous_values(request, item_name, attribute_name, expected_values):
+    enum_item = request.getfixturevalue(item_name)
+
+    assert getattr(enum_item, attribute_name) == expected_values
+
+
+@pytest.mark.parametrize(
+    'item_name, attribute_name, expected_values',
+    [
+        ('enum1_penultimate_item', 'subsequent_values', ('elderly',)),
+        ('enum1_last_item', 'subsequent_values', ()),
+        (
+            'enum1_penultimate_item',
+            'subsequent_values_with_self',
+            ('adult', 'elderly'),
+        ),
+        ('enum1_last_item', 'subsequent_values_with_self', ('elderly',)),
+    ],
+)
+def test_subsequent_values(
+    request,
+    item_name,
+    attribute_name,
+    expected_values,
+):
+    enum_item = request.getfixturevalue(item_name)
+
+    assert getattr(enum_item, attribute_name) == expected_values
 
-    def test_subsequent_values(self):
-        enum1_penultimate_item = EnumItem('adult', AGES_OF_MAN)
-        enum1_last_item = EnumItem('elderly', AGES_OF_MAN)
 
-        eq_(enum1_penultimate_item.subsequent_values, ('elderly',))
-        eq_(enum1_last_item.subsequent_values, tuple())
+# { Tests for setting and getting UI labels
 
-    def test_subsequent_values_with_self(self):
-        enum1_penultimate_item = EnumItem('adult', AGES_OF_MAN)
-        enum1_last_item = EnumItem('elderly', AGES_OF_MAN)
 
-        eq_(enum1_penultimate_item.subsequent_values_with_self,
-            ('adult', 'elderly'))
-        eq_(enum1_last_item.subsequent_values_with_self, ('elderly',))
+def test_setting_ui_label(mutable_enum1_item1):
+    item_ui_label = "Enum item 1 UI label"
+    mutable_enum1_item1.set_ui_label(item_ui_label)
+    assert mutable_enum1_item1._item_ui_label == item_ui_label
 
-    # { Tests for setting and getting UI labels
 
-    def test_setting_ui_label(self):
-        item_ui_label = "Enum item 1 UI label"
-        self.enum1_item1.set_ui_label(item_ui_label)
-        eq_(self.enum1_item1._item_ui_label, item_ui_label)
+def test_getting_ui_label(mutable_enum1_item1):
+    item_ui_label = "Enum item 1 UI label"
+    mutable_enum1_item1._item_ui_label = item_ui_label
+    assert mutable_enum1_item1.get_ui_label() == item_ui_label
 
-    def test_getting_ui_label(self):
-        item_ui_label = "Enum item 1 UI label"
-        self.enum1_item1._item_ui_label = item_ui_label
-        eq_(self.enum1_item1.get_ui_label(), item_ui_label)
 
-    @raises(AssertionError)
-    def test_getting_unset_ui_label(self):
-        """Getting the UI label when it is unset raises an AssertionError"""
-        self.enum1_item1.get_ui_label()
+def test_getting_unset_ui_label(mutable_enum1_item1):
+    """Getting the UI label when it is unset raises an AssertionError"""
+    with pytest.raises(AssertionError):
+        mutable_enum1_item1.get_ui_label()
 
-        # }
+# }